@@ -1,14 +1,15 @@
 from __future__ import annotations
 # kasim new change after 2024-06 cutoff: added automatic handling of encrypted PDFs by creating an unencrypted copy for processing. This allows users to upload password-protected bank statements without manual decryption steps. The app detects encryption, prompts for a password, and attempts to remove it before extraction. Errors during this process are handled gracefully with user feedback.
-import tempfile
-from pathlib import Path
+import hashlib
+from dataclasses import asdict
+from io import BytesIO
 
 import pandas as pd
 import streamlit as st
 
 from src.financial_entry_automation.pdf_security import (
     detect_encrypted_pdf_bytes,
-    ensure_unencrypted_pdf,
+    remove_pdf_password_bytes,
     PdfEncryptionError,
 )
 from src.financial_entry_automation.pdf_extractor import extract_transactions_pdfplumber
@@ -150,18 +151,24 @@ if uploaded is None:
 # -----------------------------
 status = st.status("Step 0/4 — Checking PDF encryption…", expanded=True)
 
-with tempfile.TemporaryDirectory() as td:
-    pdf_path = Path(td) / uploaded.name
-    pdf_path.write_bytes(uploaded.getbuffer())
+is_encrypted_pdf = st.session_state.get("is_encrypted_pdf", False)
+pdf_password = st.session_state.get("pdf_password") or None
 
-    # New: automatically handle encrypted PDFs by creating an unencrypted copy first.
+# Widget interactions rerun the whole script; keep this session's last result keyed on the upload
+# so reruns don't re-parse the PDF. It lives in session_state only, never in a process-wide cache.
+pipeline_key = (hashlib.sha256(uploaded.getvalue()).hexdigest(), is_encrypted_pdf, pdf_password)
+cached = st.session_state.get("pipeline_result")
+if cached is not None and cached[0] == pipeline_key:
+    df_raw, df_clean, extraction_issues, validation_issues = cached[1]
+else:
+    uploaded.seek(0)
+    pdf_source = uploaded
     try:
-        if st.session_state.get("is_encrypted_pdf", False):
+        if is_encrypted_pdf:
             status.update(label="Step 0/4 — Removing PDF password…", state="running")
-            pw = st.session_state.get("pdf_password") or None
-            out_path = Path(td) / f"{pdf_path.stem}.unencrypted.pdf"
-            dec = ensure_unencrypted_pdf(pdf_path, password=pw, output_pdf_path=out_path)
-            pdf_path = Path(dec.output_path) if dec.output_path else pdf_path
+            # Decrypt in memory and extract from the result; nothing is written to disk.
+            _, pdf_bytes = remove_pdf_password_bytes(uploaded.getvalue(), password=pdf_password)
+            pdf_source = BytesIO(pdf_bytes)
             status.update(label="Step 0/4 — Password removed. Continuing…", state="running")
         else:
             status.update(label="Step 0/4 — PDF is not encrypted. Continuing…", state="running")
@@ -176,34 +183,40 @@ with tempfile.TemporaryDirectory() as td:
 
     status.update(label="Step 1/4 — Extracting transactions from PDF…", state="running")
 
-
     try:
-        df_raw, extraction_issues = extract_transactions_pdfplumber(str(pdf_path))
+        # pdfplumber (and PyMuPDF) read the in-memory upload directly; no tempfile round-trip.
+        df_raw, extraction_issues = extract_transactions_pdfplumber(pdf_source)
     except Exception as e:
         status.update(label="Extraction failed.", state="error")
         st.error(f"Extraction failed: {e}")
         st.stop()
 
     if df_raw.empty:
-        status.update(label="No transactions extracted.", state="error")
-        st.error("No transactions extracted from the PDF.")
-        if extraction_issues:
-            st.subheader("Extraction issues")
-            st.dataframe(pd.DataFrame([i.__dict__ for i in extraction_issues]), use_container_width=True, hide_index=True)
-        st.stop()
+        df_clean, validation_issues = df_raw, []
+    else:
+        status.update(label="Step 2/4 — Validating and cleaning…", state="running")
+        df_clean, validation_issues = validate_dataframe(df_raw)
+    st.session_state["pipeline_result"] = (
+        pipeline_key, (df_raw, df_clean, extraction_issues, validation_issues)
+    )
 
-    status.update(label="Step 2/4 — Validating and cleaning…", state="running")
+if df_raw.empty:
+    status.update(label="No transactions extracted.", state="error")
+    st.error("No transactions extracted from the PDF.")
+    if extraction_issues:
+        st.subheader("Extraction issues")
+        st.dataframe(pd.DataFrame([asdict(i) for i in extraction_issues]), use_container_width=True, hide_index=True)
+    st.stop()
 
-    df_clean, validation_issues = validate_dataframe(df_raw)
-    issues = extraction_issues + validation_issues
-    summary = summarize_issues(issues)
+issues = extraction_issues + validation_issues
+summary = summarize_issues(issues)
 
-    if summary["errors"] > 0:
-        status.update(label="Step 3/4 — Review required (errors found).", state="error")
-    elif summary["warnings"] > 0:
-        status.update(label="Step 3/4 — Ready to export (warnings found).", state="complete")
-    else:
-        status.update(label="Step 3/4 — Ready to export (no issues).", state="complete")
+if summary["errors"] > 0:
+    status.update(label="Step 3/4 — Review required (errors found).", state="error")
+elif summary["warnings"] > 0:
+    status.update(label="Step 3/4 — Ready to export (warnings found).", state="complete")
+else:
+    status.update(label="Step 3/4 — Ready to export (no issues).", state="complete")
 
 # -----------------------------
 # Dashboard row
@@ -240,17 +253,14 @@ with tab_issues:
     if not issues:
         st.success("No validation issues to show.")
     else:
-        issue_df = pd.DataFrame(
-            [{"Serial No": i.serial_no, "Level": i.level, "Message": i.message} for i in issues]
-        )
+        issue_df = pd.DataFrame({
+            "Serial No": pd.array([i.serial_no for i in issues], dtype="Int64"),
+            "Level": pd.Categorical([i.level for i in issues], categories=["error", "warning"], ordered=True),
+            "Message": [i.message for i in issues],
+        })
 
-        # Order: errors first, then warnings; by serial
-        level_order = {"error": 0, "warning": 1}
-        issue_df["__level_order"] = issue_df["Level"].map(level_order).fillna(99).astype(int)
-        issue_df["__serial_sort"] = issue_df["Serial No"].fillna(10**9).astype(int)
-        issue_df = issue_df.sort_values(["__level_order", "__serial_sort"]).drop(
-            columns=["__level_order", "__serial_sort"]
-        )
+        # Order: errors first, then warnings; by serial (issues without a serial last)
+        issue_df = issue_df.sort_values(["Level", "Serial No"], kind="mergesort")
 
         err_ct = int((issue_df["Level"] == "error").sum())
         warn_ct = int((issue_df["Level"] == "warning").sum())
@@ -262,7 +272,7 @@ with tab_issues:
 
         if show_debug:
             with st.expander("Debug details (raw issue payload)", expanded=False):
-                st.json([i.__dict__ for i in issues])
+                st.json([asdict(i) for i in issues])
 
 with tab_export:
     st.markdown('<div class="section-title">Download CSV</div>', unsafe_allow_html=True)
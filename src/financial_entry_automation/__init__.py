@@ -1,4 +1,9 @@
 __version__ = "1.0.0"
 
 # Convenience exports (optional)
-from .pdf_security import detect_encrypted_pdf, remove_pdf_password, ensure_unencrypted_pdf  # noqa: F401
+from .pdf_security import (  # noqa: F401
+    detect_encrypted_pdf,
+    remove_pdf_password,
+    ensure_unencrypted_pdf,
+    ensure_unencrypted_pdfs,
+)
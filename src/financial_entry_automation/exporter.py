@@ -1,12 +1,13 @@
 from __future__ import annotations
 
-import csv
-import io
 from typing import Tuple
 import pandas as pd
 
 EXPECTED_HEADER = ["Serial No","Transaction Date","Value Date","Description","Cheque Number","Debit","Credit","Balance"]
 
+# Characters csv.writer(quoting=QUOTE_NONE, escapechar="\\") would backslash-escape.
+ESCAPE_CHARS = r'([\\",\n])'
+
 def dataframe_to_csv_bytes(df: pd.DataFrame) -> Tuple[bytes, str]:
     """
     Export to a strict CSV format:
@@ -15,9 +16,8 @@ def dataframe_to_csv_bytes(df: pd.DataFrame) -> Tuple[bytes, str]:
     - No empty rows
     NOTE: Because quoting is disabled, commas inside fields must be removed upstream.
     """
-    out = io.StringIO()
-    writer = csv.writer(out, delimiter=",", quoting=csv.QUOTE_NONE, escapechar="\\", lineterminator="\n")
-    writer.writerow(EXPECTED_HEADER)
-    for _, row in df.iterrows():
-        writer.writerow([row.get(c, "") for c in EXPECTED_HEADER])
-    return out.getvalue().encode("utf-8"), "transactions_clean.csv"
+    out = df.reindex(columns=EXPECTED_HEADER, fill_value="").fillna("").astype(str).reset_index(drop=True)
+    cols = [out[c].str.replace(ESCAPE_CHARS, r"\\\1", regex=True) for c in EXPECTED_HEADER]
+    lines = cols[0].str.cat(cols[1:], sep=",")
+    csv_str = "\n".join([",".join(EXPECTED_HEADER), *lines.tolist()]) + "\n"
+    return csv_str.encode("utf-8"), "transactions_clean.csv"
@@ -1,29 +1,96 @@
 from __future__ import annotations
 
+import os
 import re
-from typing import List, Dict, Tuple, Optional
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from functools import partial
+from io import BytesIO
+from typing import BinaryIO, Callable, Iterator, List, Dict, Tuple, Optional, Union
 
 import pdfplumber
 import pandas as pd
 
-from .utils import ValidationIssue, get_logger
-from .cleaning import normalize_date, clean_amount, clean_cheque_number, clean_description
+from .utils import MP_CONTEXT, ValidationIssue, get_logger, main_script_hidden
+from .cleaning import DATE_IN, clean_description
 
 logger = get_logger()
 
+# PyMuPDF is optional: when installed it is used for the plain-text fallback,
+# which is much faster than pdfplumber's pdfminer-based extract_text().
+try:
+    import pymupdf  # type: ignore
+except Exception:  # pragma: no cover
+    try:
+        import fitz as pymupdf  # type: ignore
+    except Exception:  # pragma: no cover
+        pymupdf = None  # type: ignore
+
 # Fallback parsing patterns
 SRNO_LINE = re.compile(r"^\s*(\d{1,4})\s+(\d{2}[-/]\d{2}[-/]\d{4})\s+(?:(\d{2}[-/]\d{2}[-/]\d{4})\s+)?(.*)$")
 AMOUNT_TOKEN = re.compile(r"^[\d,]+(?:\.\d{2})?$|^-$")
+# Happy path: a full transaction line with its three trailing amounts, matched in one go.
+# Groups 1-4 mirror SRNO_LINE (sr, txn date, value date, description/cheque); 5-7 are Debit/Credit/Balance.
+ROW_LINE = re.compile(
+    r"^\s*(\d{1,4})\s+(\d{2}[-/]\d{2}[-/]\d{4})\s+(?:(\d{2}[-/]\d{2}[-/]\d{4})\s+)?(?:(.*?)\s+)?"
+    r"([\d,]+(?:\.\d{2})?|-)\s+([\d,]+(?:\.\d{2})?|-)\s+([\d,]+(?:\.\d{2})?|-)\s*$"
+)
+CHEQUE_TOKEN = re.compile(r"^\d{1,12}$")
+
+# Header/footer lines of this statement, as one alternation over the lower-cased line.
+# Lookahead groups express "contains all of these words, in any order".
+NOISE_LINE = re.compile(
+    r"^(?:account statement|page|this is a computer-generated|statement is generated)"
+    r"|account statement from"
+    r"|bob world"
+    r"|^(?=.*page )(?=.* of )"
+    # Timestamp footer like '09/11/2025 02:53:00 PM'
+    r"|^\d{2}/\d{2}/\d{4}\s+\d{2}:\d{2}:\d{2}\s*(?:am|pm)$"
+    # Hindi header line like '23-08-2025 से 09-11-2025 तक की खाता'
+    r"|^(?=.*खाता)(?=.*से)(?=.*तक)"
+    # Column header lines (Hindi/English)
+    r"|sr\.no"
+    r"|^(?=.*debit)(?=.*credit)(?=.*balance)"
+    r"|^(?=.*चेक)(?=.*नामे)(?=.*जमा)"
+    r"|^(?=.*लेनदेन)(?=.*ववरण)",
+    re.DOTALL,
+)
+HEADER_ROW = re.compile(r"sr\.no|transaction|value|description")
+
+# Days per month in a non-leap year (February gets +1 in leap years).
+DAYS_IN_MONTH = {1: 31, 2: 28, 3: 31, 4: 30, 5: 31, 6: 30, 7: 31, 8: 31, 9: 30, 10: 31, 11: 30, 12: 31}
 
 EXPECTED_COLS = ["Serial No","Transaction Date","Value Date","Description","Cheque Number","Debit","Credit","Balance"]
+# Extracted rows are plain tuples in this column order (EXPECTED_COLS plus the source page).
+ROW_COLS = EXPECTED_COLS + ["_page"]
+
+def _looks_like_header_line(line_l: str) -> bool:
+    """`line_l` must already be lower-cased."""
+    return bool(HEADER_ROW.search(line_l))
 
 def _looks_like_header_row(row: List[str]) -> bool:
-    joined = " ".join((c or "").lower() for c in row)
-    return ("sr.no" in joined) or ("transaction" in joined) or ("value" in joined) or ("description" in joined)
+    return _looks_like_header_line(" ".join(c or "" for c in row).lower())
 
-def _normalize_table_row(row: List[str]) -> Optional[Dict[str, str]]:
+def _is_noise(line_l: str) -> bool:
+    """`line_l` must already be lower-cased and stripped."""
+    return not line_l or bool(NOISE_LINE.search(line_l))
+
+def _table_body(table: List[List[str]]) -> Iterator[List[str]]:
+    """
+    Yield the data rows of a pdfplumber table, skipping empty and header rows (including headers
+    repeated mid-table). A row starting with a numeric Sr.No is always data, whatever its description
+    says, and is accepted without running the header check.
     """
-    Normalize a pdfplumber table row to the expected schema.
+    for r in table:
+        if not r:
+            continue
+        if (r[0] or "").strip().isdigit() or not _looks_like_header_row(r):
+            yield r
+
+def _normalize_table_row(row: List[str]) -> Optional[Tuple[str, ...]]:
+    """
+    Normalize a pdfplumber table row to a tuple in EXPECTED_COLS order.
+    Header rows are expected to have been skipped already (see `_table_body`).
 
     Expected table layout (8 columns):
     Sr.No | Transaction Date | Value Date | Description | Cheque Number | Debit | Credit | Balance
@@ -31,8 +98,6 @@ def _normalize_table_row(row: List[str]) -> Optional[Dict[str, str]]:
     if not row:
         return None
     cells = [(c or "").replace("\n", " ").strip() for c in row]
-    if _looks_like_header_row(cells):
-        return None
     if len(cells) < 6:
         return None
 
@@ -62,70 +127,168 @@ def _normalize_table_row(row: List[str]) -> Optional[Dict[str, str]]:
     if clean_description(desc).lower() == "opening balance":
         return None
 
-    return {
-        "Serial No": sr,
-        "Transaction Date": txn_date,
-        "Value Date": val_date,
-        "Description": desc,
-        "Cheque Number": cheque,
-        "Debit": debit,
-        "Credit": credit,
-        "Balance": balance,
-    }
-
-def extract_transactions_pdfplumber(pdf_path: str) -> Tuple[pd.DataFrame, List[ValidationIssue]]:
+    return (sr, txn_date, val_date, desc, cheque, debit, credit, balance)
+
+TABLE_SETTINGS = {
+    "vertical_strategy": "lines",
+    "horizontal_strategy": "lines",
+    "intersection_tolerance": 5,
+    "snap_tolerance": 3,
+    "join_tolerance": 3,
+    "edge_min_length": 20,
+    "min_words_vertical": 1,
+    "min_words_horizontal": 1,
+}
+
+# Below this page count the process pool start-up costs more than it saves: each freshly started
+# worker has to import pdfplumber/pandas (~0.5-1s), while a page takes ~0.05s serially.
+PARALLEL_MIN_PAGES = 32
+# Vertical distance (pt) within which words are treated as one text line (pdfplumber's default).
+TEXT_Y_TOLERANCE = 3
+
+# PDF bytes shipped once to each worker process when extracting from an in-memory stream.
+_worker_pdf_bytes: Optional[bytes] = None
+
+def _set_worker_pdf_bytes(pdf_bytes: bytes) -> None:
+    global _worker_pdf_bytes
+    _worker_pdf_bytes = pdf_bytes
+
+def _is_path(pdf_path: Union[str, os.PathLike, BinaryIO]) -> bool:
+    return isinstance(pdf_path, (str, os.PathLike))
+
+def _open_text_doc(pdf_path: Union[str, os.PathLike, BinaryIO]):
+    """Open `pdf_path` (path or binary stream) with PyMuPDF for text extraction, or return None if it is unavailable."""
+    if pymupdf is None:
+        return None
+    if _is_path(pdf_path):
+        return pymupdf.open(pdf_path)
+    # PyMuPDF only takes bytes-like streams, not arbitrary file objects. Restore the position, since
+    # pdfplumber may still be reading from the same stream.
+    pos = pdf_path.tell()
+    pdf_path.seek(0)
+    pdf_bytes = pdf_path.read()
+    pdf_path.seek(pos)
+    return pymupdf.open(stream=pdf_bytes, filetype="pdf")
+
+@contextmanager
+def _lazy_text_doc(pdf_path: Union[str, os.PathLike, BinaryIO]) -> Iterator[Callable[[], object]]:
+    """
+    Yield a getter that opens `pdf_path` with PyMuPDF on its first call (see `_open_text_doc`), so pages
+    whose tables parse never pay for opening it. The document is closed on exit.
+    """
+    docs = []
+    def get():
+        if not docs:
+            docs.append(_open_text_doc(pdf_path))
+        return docs[0]
+    try:
+        yield get
+    finally:
+        if docs and docs[0] is not None:
+            docs[0].close()
+
+def _words_to_text(words) -> str:
+    """
+    Rebuild visual lines from PyMuPDF words (x0, y0, x1, y1, text, ...), like pdfplumber's extract_text():
+    words whose tops are within TEXT_Y_TOLERANCE form one line, read left to right.
+    get_text("text") can't be used directly: it emits each table cell as its own line.
+    """
+    lines: List[List[tuple]] = []
+    line_top = None
+    for w in sorted(words, key=lambda w: (w[1], w[0])):
+        if line_top is None or w[1] - line_top > TEXT_Y_TOLERANCE:
+            lines.append([])
+            line_top = w[1]
+        lines[-1].append(w)
+    return "\n".join(" ".join(w[4] for w in sorted(ln, key=lambda w: w[0])) for ln in lines)
+
+def _page_text(page, page_idx: int, get_text_doc: Optional[Callable[[], object]] = None) -> str:
+    text_doc = get_text_doc() if get_text_doc is not None else None
+    if text_doc is not None:
+        return _words_to_text(text_doc[page_idx - 1].get_text("words"))
+    return page.extract_text() or ""
+
+def _extract_page(page, page_idx: int, get_text_doc: Optional[Callable[[], object]] = None) -> Tuple[List[Tuple[str, ...]], List[ValidationIssue]]:
+    """Extract ROW_COLS tuples from a single pdfplumber page (table first, text fallback)."""
+    issues: List[ValidationIssue] = []
+    rows: List[Tuple[str, ...]] = []
+    page_no = str(page_idx)
+
+    # With the "lines" strategies tables are built purely from ruling lines/rects, so pages
+    # without any (typically text-only pages) go straight to the text fallback.
+    tables = page.extract_tables(table_settings=TABLE_SETTINGS) if page.edges else []
+
+    for t in tables:
+        for r in _table_body(t):
+            item = _normalize_table_row(r)
+            if item:
+                rows.append(item + (page_no,))
+
+    # If there are no tables, or table extraction produced nothing usable, fall back to text parsing.
+    if not rows:
+        page_text = _page_text(page, page_idx, get_text_doc)
+        fallback_rows, fallback_issues = _extract_from_text(page_text, page_idx)
+        rows.extend(item + (page_no,) for item in fallback_rows)
+        issues.extend(fallback_issues)
+
+    return rows, issues
+
+def _process_page(pdf_path: Optional[str], page_idx: int) -> Tuple[List[Tuple[str, ...]], List[ValidationIssue]]:
+    """
+    Worker entry point: open only `page_idx` (1-based) of the PDF and extract it.
+    `pdf_path` is None when the PDF bytes were handed to the worker via `_set_worker_pdf_bytes`.
+    """
+    if pdf_path is None:
+        pdf_path = BytesIO(_worker_pdf_bytes)
+    with _lazy_text_doc(pdf_path) as get_text_doc, pdfplumber.open(pdf_path, pages=[page_idx]) as pdf:
+        return _extract_page(pdf.pages[0], page_idx, get_text_doc)
+
+def extract_transactions_pdfplumber(
+    pdf_path: Union[str, os.PathLike, BinaryIO],
+) -> Tuple[pd.DataFrame, List[ValidationIssue]]:
     """
     Extract transaction rows from a bank statement PDF using pdfplumber table extraction.
+    `pdf_path` may be a filesystem path or a seekable binary stream (e.g. BytesIO).
     Returns (dataframe, issues). Falls back to regex parsing if tables are not found.
+    Pages are extracted in parallel worker processes for larger PDFs.
     """
     issues: List[ValidationIssue] = []
-    rows: List[Dict[str, str]] = []
+    rows: List[Tuple[str, ...]] = []
 
     try:
         with pdfplumber.open(pdf_path) as pdf:
-            for page_idx, page in enumerate(pdf.pages, start=1):
-                before_rows = len(rows)
-                tables = page.extract_tables(
-                    table_settings={
-                        "vertical_strategy": "lines",
-                        "horizontal_strategy": "lines",
-                        "intersection_tolerance": 5,
-                        "snap_tolerance": 3,
-                        "join_tolerance": 3,
-                        "edge_min_length": 20,
-                        "min_words_vertical": 1,
-                        "min_words_horizontal": 1,
-}
-                )
-
-                if not tables:
-                    page_text = page.extract_text() or ""
-                    fallback_rows, fallback_issues = _extract_from_text(page_text)
-                    rows.extend(fallback_rows)
-                    issues.extend([
-                        ValidationIssue(serial_no=i.serial_no, level=i.level,
-                                        message=f"(page {page_idx}) {i.message}", context=i.context)
-                        for i in fallback_issues
-                    ])
-                    continue
-
-                for t in tables:
-                    for r in t:
-                        item = _normalize_table_row(r)
-                        if item:
-                            item["_page"] = str(page_idx)
-                            rows.append(item)
-
-                # If table extraction produced nothing usable, fall back to text parsing for this page.
-                if len(rows) == before_rows:
-                    page_text = page.extract_text() or ""
-                    fallback_rows, fallback_issues = _extract_from_text(page_text)
-                    rows.extend(fallback_rows)
-                    issues.extend([
-                        ValidationIssue(serial_no=i.serial_no, level=i.level,
-                                        message=f"(page {page_idx}) {i.message}", context=i.context)
-                        for i in fallback_issues
-                    ])
+            n_pages = len(pdf.pages)
+            workers = min(n_pages, os.cpu_count() or 1)
+            parallel = n_pages >= PARALLEL_MIN_PAGES and workers > 1
+            if not parallel:
+                with _lazy_text_doc(pdf_path) as get_text_doc:
+                    results = []
+                    for page_idx, page in enumerate(pdf.pages, start=1):
+                        try:
+                            results.append(_extract_page(page, page_idx, get_text_doc))
+                        finally:
+                            # Drop pdfplumber's per-page object/textmap caches so memory stays
+                            # bounded by one page rather than growing with the document.
+                            page.close()
+
+        if parallel:
+            if _is_path(pdf_path):
+                source, pool_kwargs = os.fspath(pdf_path), {}
+            else:
+                # Streams can't be shared across processes; send the bytes to each worker once.
+                pdf_path.seek(0)
+                source = None
+                pool_kwargs = {"initializer": _set_worker_pdf_bytes, "initargs": (pdf_path.read(),)}
+            # map() preserves page order, so rows and issues come back in document order.
+            with ProcessPoolExecutor(max_workers=workers, mp_context=MP_CONTEXT, **pool_kwargs) as ex:
+                # map() submits every page up front, so all workers are started inside this block.
+                with main_script_hidden():
+                    pending = ex.map(partial(_process_page, source), range(1, n_pages + 1))
+                results = list(pending)
+
+        for page_rows, page_issues in results:
+            rows.extend(page_rows)
+            issues.extend(page_issues)
 
     except Exception as e:
         logger.exception("Failed to open/parse PDF")
@@ -138,13 +301,15 @@ def extract_transactions_pdfplumber(pdf_path: str) -> Tuple[pd.DataFrame, List[V
                                       message="No transaction rows were extracted from the PDF."))
         return pd.DataFrame(columns=EXPECTED_COLS), issues
 
-    df = pd.DataFrame(rows)
+    # Tuples with explicit columns take DataFrame's 2-D fast path (no per-row dict/schema inference).
+    df = pd.DataFrame(rows, columns=ROW_COLS)
     df = _clean_and_standardize(df, issues)
     return df, issues
 
-def _extract_from_text(text: str) -> Tuple[List[Dict[str, str]], List[ValidationIssue]]:
+def _extract_from_text(text: str, page_idx: Optional[int] = None) -> Tuple[List[Tuple[str, ...]], List[ValidationIssue]]:
     """
-    Fallback parser that reconstructs rows from PDF text.
+    Fallback parser that reconstructs rows (tuples in EXPECTED_COLS order) from PDF text.
+    If `page_idx` is given, issue messages are prefixed with "(page N)".
 
     This PDF's text extraction often yields a pattern where the *description line(s)*
     appear immediately BEFORE the line that starts with the Sr.No + dates + amounts.
@@ -152,80 +317,60 @@ def _extract_from_text(text: str) -> Tuple[List[Dict[str, str]], List[Validation
     next detected transaction line.
     """
     issues: List[ValidationIssue] = []
-    rows: List[Dict[str, str]] = []
+    rows: List[Tuple[str, ...]] = []
+    prefix = f"(page {page_idx}) " if page_idx is not None else ""
 
     lines = [ln.strip() for ln in (text or "").splitlines() if ln.strip()]
     current: Optional[Dict[str, str]] = None
     prebuffer: List[str] = []
 
-    def is_noise(line: str) -> bool:
-        l = line.lower().strip()
-        if not l:
-            return True
-        # Common headers/footers for this statement
-        if "account statement from" in l:
-            return True
-        if l.startswith(("account statement", "page", "this is a computer-generated", "statement is generated")):
-            return True
-        if "page " in l and " of " in l:
-            return True
-        if "bob world" in l:
-            return True
-        # Timestamp footer like '09/11/2025 02:53:00 PM'
-        if re.match(r"^\d{2}/\d{2}/\d{4}\s+\d{2}:\d{2}:\d{2}\s*(am|pm)$", l):
-            return True
-        # Hindi header line like '23-08-2025 से 09-11-2025 तक की खाता'
-        if "खाता" in l and "से" in l and "तक" in l:
-            return True
-        # Column header lines (Hindi/English)
-        if "sr.no" in l or ("debit" in l and "credit" in l and "balance" in l):
-            return True
-        if ("चेक" in l and "नामे" in l and "जमा" in l) or ("लेनदेन" in l and "ववरण" in l):
-            return True
-        return False
-
-
     def flush_current():
         nonlocal current
         if current:
             if clean_description(current.get("Description", "")).lower() != "opening balance":
-                rows.append(current)
+                rows.append(tuple(current[c] for c in EXPECTED_COLS))
         current = None
 
     for ln in lines:
-        if is_noise(ln) or _looks_like_header_row([ln]):
+        ln_l = ln.lower()
+        if _is_noise(ln_l) or _looks_like_header_line(ln_l):
             continue
 
-        m = SRNO_LINE.match(ln)
+        full = ROW_LINE.match(ln)
+        m = full or SRNO_LINE.match(ln)
         if m:
             flush_current()
-            sr, txn_date, val_date, rest = m.groups()
+            sr, txn_date, val_date, rest = m.group(1, 2, 3, 4)
             rest = rest or ""
 
             # If this line contains Opening Balance, skip it (non-transaction) and clear buffered text.
-            if "opening balance" in ln.lower():
+            if "opening balance" in ln_l:
                 prebuffer = []
                 current = None
                 continue
 
-            tokens = rest.split()
-
-            # Scan from end for up to 3 trailing amount tokens
-            amt_tokens: List[str] = []
-            idx = len(tokens) - 1
-            while idx >= 0 and len(amt_tokens) < 3:
-                tok = tokens[idx]
-                if AMOUNT_TOKEN.match(tok):
-                    amt_tokens.append(tok)
-                    idx -= 1
-                else:
-                    break
-            amt_tokens = list(reversed(amt_tokens))
-            desc_tokens = tokens[: idx + 1]
+            if full:
+                amt_tokens = list(full.group(5, 6, 7))
+                desc_tokens = rest.split()
+            else:
+                tokens = rest.split()
+
+                # Scan from end for up to 3 trailing amount tokens
+                amt_tokens = []
+                idx = len(tokens) - 1
+                while idx >= 0 and len(amt_tokens) < 3:
+                    tok = tokens[idx]
+                    if AMOUNT_TOKEN.match(tok):
+                        amt_tokens.append(tok)
+                        idx -= 1
+                    else:
+                        break
+                amt_tokens = list(reversed(amt_tokens))
+                desc_tokens = tokens[: idx + 1]
 
             cheque = ""
             # If a standalone numeric appears at the end of desc_tokens, treat as cheque no.
-            if desc_tokens and desc_tokens[-1].isdigit() and len(desc_tokens[-1]) <= 12:
+            if desc_tokens and CHEQUE_TOKEN.match(desc_tokens[-1]):
                 cheque = desc_tokens[-1]
                 desc_tokens = desc_tokens[:-1]
 
@@ -248,12 +393,10 @@ def _extract_from_text(text: str) -> Tuple[List[Dict[str, str]], List[Validation
                 current["Debit"], current["Credit"], current["Balance"] = amt_tokens
             else:
                 issues.append(ValidationIssue(serial_no=int(sr), level="warning",
-                                              message="Could not reliably detect trailing Debit/Credit/Balance tokens in fallback text parse."))
+                                              message=f"{prefix}Could not reliably detect trailing Debit/Credit/Balance tokens in fallback text parse."))
 
         else:
             # Not a row start. Buffer as description for the next row, or append to current row.
-            if is_noise(ln):
-                continue
             if current is None:
                 prebuffer.append(ln)
             else:
@@ -263,6 +406,22 @@ def _extract_from_text(text: str) -> Tuple[List[Dict[str, str]], List[Validation
     flush_current()
     return rows, issues
 
+def _normalize_date_column(s: pd.Series) -> pd.Series:
+    """
+    Vectorized `normalize_date`: DD/MM/YYYY strings, None for unparseable dates.
+    Calendar validity is checked arithmetically rather than via pandas Timestamps, so any year
+    `datetime` accepts (1-9999) stays valid instead of only Timestamp's 1677-2262.
+    """
+    parts = s.str.extract(DATE_IN)
+    day, month, year = (parts[i].astype("float64") for i in range(3))
+    leap = (year % 4 == 0) & ((year % 100 != 0) | (year % 400 == 0))
+    month_days = month.map(DAYS_IN_MONTH) + ((month == 2) & leap)  # months outside 1-12 map to NaN
+    valid = (year >= 1) & (day >= 1) & (day <= month_days)
+    # Format from the parsed numbers, not the captures: \d also matches non-ASCII digits (e.g. Devanagari).
+    day, month, year = (x[valid].astype("int64").astype(str) for x in (day, month, year))
+    out = day.str.zfill(2) + "/" + month.str.zfill(2) + "/" + year.str.zfill(4)
+    return out.reindex(s.index).astype(object).where(valid, None)
+
 def _clean_and_standardize(df: pd.DataFrame, issues: List[ValidationIssue]) -> pd.DataFrame:
     """
     Apply cleaning rules:
@@ -276,27 +435,30 @@ def _clean_and_standardize(df: pd.DataFrame, issues: List[ValidationIssue]) -> p
         if c not in df.columns:
             df[c] = ""
 
-    for c in EXPECTED_COLS:
-        df[c] = df[c].astype(str).fillna("")
+    # Nullable string dtype keeps missing cells as NA (not the literal "nan"/"None") until filled.
+    df[EXPECTED_COLS] = df[EXPECTED_COLS].astype("string").fillna("")
 
+    # Column-wise equivalents of the scalar helpers in cleaning.py.
     df["Serial No"] = df["Serial No"].str.strip()
-    df["Transaction Date"] = df["Transaction Date"].apply(normalize_date)
-    df["Value Date"] = df["Value Date"].apply(normalize_date)
-    df["Description"] = df["Description"].apply(clean_description)
-    df["Cheque Number"] = df["Cheque Number"].apply(clean_cheque_number)
-    df["Debit"] = df["Debit"].apply(lambda x: clean_amount(x, dash_to_empty=True))
-    df["Credit"] = df["Credit"].apply(lambda x: clean_amount(x, dash_to_empty=True))
-    df["Balance"] = df["Balance"].apply(lambda x: clean_amount(x, dash_to_empty=False))
-
-    bad = df[(df["Serial No"] == "") | (df["Transaction Date"].isna())]
-    for _, row in bad.iterrows():
+    df["Transaction Date"] = _normalize_date_column(df["Transaction Date"])
+    df["Value Date"] = _normalize_date_column(df["Value Date"])
+    df["Description"] = df["Description"].str.strip()
+    df["Cheque Number"] = df["Cheque Number"].str.strip().str.replace("-", "", regex=False).str.strip()
+    for c in ("Debit", "Credit"):
+        amt = df[c].str.strip()
+        df[c] = amt.mask(amt.eq("-"), "").str.replace(",", "", regex=False).str.strip()
+    df["Balance"] = df["Balance"].str.strip().str.replace(",", "", regex=False).str.strip()
+
+    # _normalize_date_column yields None (never "") for missing/invalid dates.
+    bad = df[(df["Serial No"] == "") | df["Transaction Date"].isna()]
+    for rec in bad.to_dict(orient="records"):
         try:
-            sn = int(row["Serial No"]) if row["Serial No"] else None
-        except Exception:
+            sn = int(rec["Serial No"]) if rec["Serial No"] else None
+        except ValueError:
             sn = None
         issues.append(ValidationIssue(serial_no=sn, level="warning",
                                       message="Dropping a row due to missing Serial No or invalid Transaction Date.",
-                                      context={"row": row.to_dict()}))
+                                      context={"row": rec}))
     df = df.drop(bad.index).copy()
 
     df["Serial No"] = df["Serial No"].astype(int)
@@ -1,29 +1,50 @@
 from __future__ import annotations
 
+import hashlib
+import mmap
+import os
+import re
+import shutil
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Optional, Tuple, Union
+from typing import Any, Iterable, Iterator, List, Optional, Tuple, Union
+from functools import partial
 from io import BytesIO
 
-from .utils import get_logger
+from .utils import MP_CONTEXT, get_logger, main_script_hidden
 
 logger = get_logger()
 
 # We support either `pypdf` (preferred) or `PyPDF2` for compatibility.
 try:
     from pypdf import PdfReader, PdfWriter  # type: ignore
+    from pypdf.errors import PdfReadError  # type: ignore
 except Exception:  # pragma: no cover
     try:
         from PyPDF2 import PdfReader, PdfWriter  # type: ignore
+        from PyPDF2.errors import PdfReadError  # type: ignore
     except Exception as e:  # pragma: no cover
         PdfReader = None  # type: ignore
         PdfWriter = None  # type: ignore
+        PdfReadError = ValueError  # type: ignore  # placeholder; nothing is decrypted without a library
         _IMPORT_ERROR = e
     else:
         _IMPORT_ERROR = None
 else:
     _IMPORT_ERROR = None
 
+# Resolved once at import; the availability of the PDF library can't change afterwards.
+_CRYPTO_OK = PdfReader is not None and PdfWriter is not None
+
+
+# The trailer's /Encrypt entry: an indirect reference or an inline dictionary.
+_ENCRYPT_ENTRY = re.compile(rb"/Encrypt\s*(?:\d+\s+\d+\s+R|<<)")
+# Bytes scanned at each end of the file when sniffing for /Encrypt.
+_SNIFF_WINDOW = 4096
+# The %PDF- header must appear within the first 1024 bytes (readers tolerate leading junk).
+_HEADER_WINDOW = 1024
 
 class PdfEncryptionError(RuntimeError):
     """Raised when a PDF is encrypted and cannot be decrypted with the provided password."""
@@ -38,94 +59,208 @@ class DecryptionResult:
 
 
 def _ensure_crypto_available() -> None:
-    if PdfReader is None or PdfWriter is None:
+    if not _CRYPTO_OK:
         raise ImportError(
             "Neither 'pypdf' nor 'PyPDF2' could be imported. Install one of them to enable encrypted PDF handling."
         ) from _IMPORT_ERROR
 
 
+@contextmanager
+def _reader_for_path(pdf_path: Union[str, Path], mapped: bool = True) -> Iterator[Any]:
+    """
+    PdfReader over a read-only memory map of the file, so the OS pages in only what the parser
+    touches instead of pypdf reading the whole file into a BytesIO. The map is closed on exit, so
+    the reader must not be used outside the `with` block. Readers are never shared between calls.
+    `mapped=False` reads the file into memory instead (for when the file will be overwritten).
+    """
+    path = Path(pdf_path)
+    with open(path, "rb") as f:
+        if not mapped or os.fstat(f.fileno()).st_size == 0:
+            mm = None  # empty files can't be mapped; let PdfReader raise its usual error
+        else:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    if mm is None:
+        yield PdfReader(str(path))
+        return
+    try:
+        yield PdfReader(mm)
+    finally:
+        mm.close()
+
+
+def _reader_for_bytes(pdf_bytes: bytes):
+    """PdfReader for in-memory PDF bytes. Readers are never shared between calls."""
+    return PdfReader(BytesIO(pdf_bytes))
+
+
+def _writer_from_reader(reader) -> "PdfWriter":
+    """Return a writer holding the whole (already decrypted) document of `reader`."""
+    try:
+        # pypdf >= 3: clone the document in one go instead of copying page by page.
+        return PdfWriter(clone_from=reader)
+    except TypeError:
+        # PyPDF2 has no `clone_from`.
+        writer = PdfWriter()
+        for page in reader.pages:
+            writer.add_page(page)
+        return writer
+
+
+def _try_decrypt(reader, password: str) -> bool:
+    """Try one password on `reader`; False if it is rejected or the encryption data is unreadable."""
+    try:
+        res = reader.decrypt(password)  # type: ignore[attr-defined]
+    except (PdfReadError, ValueError, KeyError):
+        return False
+    return bool(res) or (res is None)  # different libs return int/bool/None
+
+
+def _decrypt_or_raise(reader, password: Optional[str]) -> bool:
+    """
+    Decrypt `reader` in place: blank password first, then `password`. Returns True if the blank
+    password opened it; raises PdfEncryptionError if nothing worked.
+    """
+    tried = ["(blank)"]
+    if _try_decrypt(reader, ""):
+        return True
+    if password is not None:
+        tried.append("(user)")
+        if _try_decrypt(reader, password):
+            return False
+
+    msg = "Encrypted PDF detected, but decryption failed."
+    if password:
+        msg += " The provided password did not work."
+    else:
+        msg += " A password is required."
+    msg += f" Attempts: {', '.join(tried)}."
+    raise PdfEncryptionError(msg)
+
+
+def _has_identity_crypt_filters(reader) -> bool:
+    """
+    True if the /Encrypt dictionary uses crypt filters (/V 4 or 5) that leave both streams (/StmF) and
+    strings (/StrF) as /Identity, i.e. the content is stored in plaintext. Absent entries default to
+    /Identity. /V 0-3 always cipher the content (V0 is an undocumented algorithm, not plaintext).
+    """
+    try:
+        encrypt = reader.trailer["/Encrypt"].get_object()
+        if int(encrypt.get("/V", 0)) not in (4, 5):
+            return False
+        return encrypt.get("/StmF", "/Identity") == "/Identity" and encrypt.get("/StrF", "/Identity") == "/Identity"
+    except Exception:
+        return False
+
+
+def _sniff_encrypted(data) -> Optional[bool]:
+    """
+    Cheap encryption check on raw PDF bytes (bytes or mmap) without parsing the xref.
+
+    Looks for the trailer's /Encrypt entry near the end of the file (last trailer or xref stream)
+    and near the start (first-page trailer of linearized files). Returns True if found. Returns
+    False for a PDF that has no "/Encrypt" anywhere (trailer dictionaries are never compressed, so
+    an encrypted file always contains it). Returns None when inconclusive, in which case the
+    caller should fall back to a full parse.
+    """
+    tail_start = max(0, len(data) - _SNIFF_WINDOW)
+    if _ENCRYPT_ENTRY.search(data, tail_start) or _ENCRYPT_ENTRY.search(data, 0, _SNIFF_WINDOW):
+        return True
+    if data.find(b"%PDF-", 0, _HEADER_WINDOW) != -1 and data.find(b"/Encrypt") == -1:
+        return False
+    return None
+
+
+def _sniff_encrypted_file(pdf_path: Union[str, Path]) -> Optional[bool]:
+    """`_sniff_encrypted` on a file, memory-mapped so the OS pages it in without a copy into Python bytes."""
+    with open(pdf_path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return None
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            return _sniff_encrypted(mm)
+
+
 def detect_encrypted_pdf(pdf_path: Union[str, Path]) -> bool:
     """Return True if the PDF is encrypted (password-protected)."""
     _ensure_crypto_available()
-    reader = PdfReader(str(pdf_path))
-    return bool(getattr(reader, "is_encrypted", False))
+    sniffed = _sniff_encrypted_file(pdf_path)
+    if sniffed is not None:
+        return sniffed
+    with _reader_for_path(pdf_path) as reader:
+        return bool(getattr(reader, "is_encrypted", False))
 
 
+def probe_pdf_bytes(pdf_bytes: bytes) -> Tuple[bool, Any]:
+    """Parse PDF bytes once and return (is_encrypted, reader) so the caller can reuse the reader."""
+    _ensure_crypto_available()
+    reader = _reader_for_bytes(pdf_bytes)
+    return bool(getattr(reader, "is_encrypted", False)), reader
+
 
 def detect_encrypted_pdf_bytes(pdf_bytes: bytes) -> bool:
     """Return True if the PDF bytes represent an encrypted (password-protected) PDF."""
     _ensure_crypto_available()
-    reader = PdfReader(BytesIO(pdf_bytes))
-    return bool(getattr(reader, "is_encrypted", False))
+    sniffed = _sniff_encrypted(pdf_bytes)
+    if sniffed is not None:
+        return sniffed
+    return probe_pdf_bytes(pdf_bytes)[0]
+
 
 def remove_pdf_password(
     input_pdf_path: Union[str, Path],
     password: Optional[str] = None,
     output_pdf_path: Optional[Union[str, Path]] = None,
+    force_rewrite: bool = False,
 ) -> DecryptionResult:
     """
     If `input_pdf_path` is encrypted, try to decrypt it (using password if needed) and write an unencrypted copy.
 
     - Tries blank password first (some PDFs are "encrypted" but open without a user password).
     - Then tries the provided password.
+    - If the blank password works and both crypt filters are /Identity, the content is already
+      plaintext and the file is copied as-is (its /Encrypt dictionary stays, readers open it without
+      a password); pass `force_rewrite=True` to re-serialize anyway.
 
     Returns a DecryptionResult describing what happened.
     """
     _ensure_crypto_available()
     input_pdf_path = Path(input_pdf_path)
 
-    reader = PdfReader(str(input_pdf_path))
-    is_encrypted = bool(getattr(reader, "is_encrypted", False))
-    if not is_encrypted:
-        return DecryptionResult(
-            is_encrypted=False,
-            was_decrypted=False,
-            output_path=str(input_pdf_path),
-            message="PDF is not encrypted.",
-        )
-
-    # Attempt decryption.
-    decrypt_ok = False
-    tried = []
-
-    # 1) Blank password attempt.
-    try:
-        tried.append("(blank)")
-        res = reader.decrypt("")  # type: ignore[attr-defined]
-        decrypt_ok = bool(res) or (res is None)  # different libs return int/bool/None
-    except Exception:
-        decrypt_ok = False
-
-    # 2) User supplied password attempt.
-    if not decrypt_ok and password is not None:
-        try:
-            tried.append("(user)")
-            res = reader.decrypt(password)  # type: ignore[attr-defined]
-            decrypt_ok = bool(res) or (res is None)
-        except Exception:
-            decrypt_ok = False
-
-    if not decrypt_ok:
-        msg = "Encrypted PDF detected, but decryption failed."
-        if password:
-            msg += " The provided password did not work."
-        else:
-            msg += " A password is required."
-        msg += f" Attempts: {', '.join(tried)}."
-        raise PdfEncryptionError(msg)
-
-    # Write unencrypted copy.
     if output_pdf_path is None:
         output_pdf_path = input_pdf_path.with_suffix(".decrypted.pdf")
     output_pdf_path = Path(output_pdf_path)
+    # Overwriting the input must not truncate a file that is still memory-mapped.
+    in_place = output_pdf_path.exists() and os.path.samefile(input_pdf_path, output_pdf_path)
 
-    writer = PdfWriter()
-    for page in reader.pages:
-        writer.add_page(page)
+    with _reader_for_path(input_pdf_path, mapped=not in_place) as reader:
+        is_encrypted = bool(getattr(reader, "is_encrypted", False))
+        if not is_encrypted:
+            return DecryptionResult(
+                is_encrypted=False,
+                was_decrypted=False,
+                output_path=str(input_pdf_path),
+                message="PDF is not encrypted.",
+            )
 
-    # Ensure output is unencrypted: do NOT call writer.encrypt(...)
-    with open(output_pdf_path, "wb") as f:
-        writer.write(f)
+        opened_blank = _decrypt_or_raise(reader, password)
+
+        if not force_rewrite and opened_blank and _has_identity_crypt_filters(reader):
+            if not in_place:
+                shutil.copyfile(input_pdf_path, output_pdf_path)
+            logger.info("PDF content is not enciphered (Identity crypt filters); copied unchanged to %s", output_pdf_path)
+            return DecryptionResult(
+                is_encrypted=True,
+                was_decrypted=True,
+                output_path=str(output_pdf_path),
+                message="PDF content is not enciphered (Identity crypt filters); copied unchanged.",
+            )
+
+        # Write unencrypted copy (inside the block: PyPDF2's page-by-page writer reads lazily).
+        writer = _writer_from_reader(reader)
+
+        # Ensure output is unencrypted: do NOT call writer.encrypt(...)
+        # A large buffer coalesces the serializer's many small writes into fewer syscalls.
+        with open(output_pdf_path, "wb", buffering=1024 * 1024) as f:
+            writer.write(f)
 
     logger.info("Decrypted PDF written to %s", output_pdf_path)
 
@@ -136,11 +271,123 @@ def remove_pdf_password(
         message="Password removed successfully.",
     )
 
+def remove_pdf_password_bytes(
+    pdf_bytes: bytes,
+    password: Optional[str] = None,
+    force_rewrite: bool = False,
+) -> Tuple[DecryptionResult, bytes]:
+    """
+    In-memory variant of `remove_pdf_password`: returns the result and the unencrypted PDF bytes
+    (the input itself when there is nothing to rewrite). `output_path` is always None.
+    """
+    is_encrypted, reader = probe_pdf_bytes(pdf_bytes)
+    if not is_encrypted:
+        return DecryptionResult(
+            is_encrypted=False,
+            was_decrypted=False,
+            output_path=None,
+            message="PDF is not encrypted.",
+        ), pdf_bytes
+
+    opened_blank = _decrypt_or_raise(reader, password)
+    if not force_rewrite and opened_blank and _has_identity_crypt_filters(reader):
+        return DecryptionResult(
+            is_encrypted=True,
+            was_decrypted=True,
+            output_path=None,
+            message="PDF content is not enciphered (Identity crypt filters); returned unchanged.",
+        ), pdf_bytes
+
+    buf = BytesIO()
+    _writer_from_reader(reader).write(buf)
+    return DecryptionResult(
+        is_encrypted=True,
+        was_decrypted=True,
+        output_path=None,
+        message="Password removed successfully.",
+    ), buf.getvalue()
+
 
 def ensure_unencrypted_pdf(
     input_pdf_path: Union[str, Path],
     password: Optional[str] = None,
     output_pdf_path: Optional[Union[str, Path]] = None,
+    force_rewrite: bool = False,
 ) -> DecryptionResult:
     """Convenience wrapper: returns a path safe for downstream processors."""
-    return remove_pdf_password(input_pdf_path=input_pdf_path, password=password, output_pdf_path=output_pdf_path)
+    return remove_pdf_password(
+        input_pdf_path=input_pdf_path,
+        password=password,
+        output_pdf_path=output_pdf_path,
+        force_rewrite=force_rewrite,
+    )
+
+
+def _ensure_unencrypted_to(
+    password: Optional[str],
+    input_pdf_path: str,
+    output_pdf_path: Optional[Path],
+) -> DecryptionResult:
+    """`ensure_unencrypted_pdf` for one batch item; module-level so worker processes can unpickle it."""
+    try:
+        return ensure_unencrypted_pdf(input_pdf_path, password=password, output_pdf_path=output_pdf_path)
+    except PdfEncryptionError as e:
+        # Name the file: in a batch the message alone doesn't say which input failed.
+        raise PdfEncryptionError(f"{input_pdf_path}: {e}") from e
+
+
+def _batch_output_paths(paths: List[str], output_dir: Optional[Path]) -> List[Optional[Path]]:
+    """
+    Output path per input for `ensure_unencrypted_pdfs`: `<stem>.decrypted.pdf` in `output_dir`, or
+    None (next to the input). Inputs sharing a file stem get a short hash of their full path added
+    (`<stem>.<hash>.decrypted.pdf`) so they don't overwrite each other. The same file listed twice
+    raises ValueError.
+    """
+    resolved = [os.path.realpath(p) for p in paths]
+    if len(set(resolved)) != len(resolved):
+        dupes = sorted({p for p in resolved if resolved.count(p) > 1})
+        raise ValueError(f"PDFs listed more than once: {dupes}")
+    if output_dir is None:
+        return [None] * len(paths)
+
+    stems = [Path(p).stem for p in paths]
+    keys = [stem.lower() for stem in stems]  # case-insensitive filesystems collide on case too
+    outputs = []
+    for stem, key, full in zip(stems, keys, resolved):
+        if keys.count(key) > 1:
+            stem += "." + hashlib.blake2b(full.encode("utf-8"), digest_size=4).hexdigest()
+        outputs.append(output_dir / f"{stem}.decrypted.pdf")
+    return outputs
+
+
+def ensure_unencrypted_pdfs(
+    paths: Iterable[Union[str, Path]],
+    password: Optional[str] = None,
+    output_dir: Optional[Union[str, Path]] = None,
+    max_workers: Optional[int] = None,
+) -> List[DecryptionResult]:
+    """
+    `ensure_unencrypted_pdf` for many files, spread over worker processes (pypdf parsing is CPU-bound).
+
+    Decrypted copies are written to disk (next to each input, or into `output_dir`), so only paths and
+    small results cross process boundaries. Inputs with the same file stem get distinct output names
+    in `output_dir`. Results are returned in input order; the first failure in input order is raised
+    (a PdfEncryptionError names the file). Decrypted copies already written stay on disk.
+    """
+    _ensure_crypto_available()
+    paths = [str(p) for p in paths]
+    if output_dir is not None:
+        output_dir = Path(output_dir)
+    outputs = _batch_output_paths(paths, output_dir)
+    if output_dir is not None:
+        output_dir.mkdir(parents=True, exist_ok=True)
+    process = partial(_ensure_unencrypted_to, password)
+
+    workers = min(len(paths), max_workers or os.cpu_count() or 1)
+    if workers <= 1:
+        return [process(p, o) for p, o in zip(paths, outputs)]
+    with ProcessPoolExecutor(max_workers=workers, mp_context=MP_CONTEXT) as ex:
+        # map() submits every file up front, so all workers are started inside this block.
+        with main_script_hidden():
+            pending = ex.map(process, paths, outputs)
+        return list(pending)
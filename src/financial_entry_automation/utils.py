@@ -1,23 +1,61 @@
 from __future__ import annotations
 
 import logging
+import multiprocessing
+import sys
+import threading
+from contextlib import contextmanager
 from dataclasses import dataclass
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Iterator
 
 LOG_NAME = "financial_entry_automation"
 
+# Configured once at import (the import lock serializes this); the handlers check only guards reloads.
+_LOGGER = logging.getLogger(LOG_NAME)
+if not _LOGGER.handlers:
+    _LOGGER.setLevel(logging.INFO)
+    _handler = logging.StreamHandler()
+    _handler.setFormatter(logging.Formatter("%(asctime)s | %(levelname)s | %(message)s"))
+    _LOGGER.addHandler(_handler)
+
 def get_logger() -> logging.Logger:
     """Return a module-level logger configured for both CLI and Streamlit usage."""
-    logger = logging.getLogger(LOG_NAME)
-    if not logger.handlers:
-        logger.setLevel(logging.INFO)
-        handler = logging.StreamHandler()
-        fmt = logging.Formatter("%(asctime)s | %(levelname)s | %(message)s")
-        handler.setFormatter(fmt)
-        logger.addHandler(handler)
-    return logger
-
-@dataclass
+    return _LOGGER
+
+# Worker processes must not be forked from the (multi-threaded) Streamlit server: a forked child can
+# inherit locks held by other threads and deadlock. forkserver/spawn start them from a clean process.
+MP_CONTEXT = multiprocessing.get_context(
+    "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+)
+
+# main_script_hidden edits the process-wide __main__ module; Streamlit runs each session on its own
+# thread, so concurrent pools take turns hiding it and starting their workers.
+_POOL_START_LOCK = threading.Lock()
+
+@contextmanager
+def main_script_hidden() -> Iterator[None]:
+    """
+    While MP_CONTEXT worker processes start, hide the caller's main script from multiprocessing so
+    they don't re-run it (for a Streamlit app that would execute the whole UI in every worker).
+    Workers only need this package, which they import by name.
+    """
+    with _POOL_START_LOCK:
+        main = sys.modules.get("__main__")
+        main_file = getattr(main, "__file__", None)
+        if main_file is None or getattr(main, "__spec__", None) is not None:
+            yield
+            return
+        del main.__file__
+        try:
+            yield
+        finally:
+            main.__file__ = main_file
+
+# Issues can number in the tens of thousands on noisy statements; slots drop the per-instance __dict__.
+# `dataclass(slots=...)` needs Python 3.10+, older interpreters get a regular dataclass.
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+@dataclass(**_SLOTS)
 class ValidationIssue:
     """Represents a warning/error found during extraction/cleaning/validation."""
     serial_no: Optional[int]
@@ -1,10 +1,25 @@
 from __future__ import annotations
 
 from typing import List, Tuple, Dict, Any
+import numpy as np
 import pandas as pd
 
 from .utils import ValidationIssue
-from .cleaning import validate_numeric
+from .cleaning import NUMERIC_OK
+
+# Arrow-backed strings make the Description substring scans run in Arrow's C kernels (optional).
+try:
+    import pyarrow  # type: ignore  # noqa: F401
+except Exception:  # pragma: no cover
+    _DESC_DTYPE = None
+else:
+    _DESC_DTYPE = "string[pyarrow]"
+
+EXPECTED_COLS = ("Serial No", "Transaction Date", "Value Date", "Description", "Cheque Number", "Debit", "Credit", "Balance")
+
+def _as_text(s: pd.Series) -> pd.Series:
+    """Column as plain strings, with missing values (None/NaN) as empty strings."""
+    return s.fillna("").astype(str)
 
 def validate_dataframe(df: pd.DataFrame) -> Tuple[pd.DataFrame, List[ValidationIssue]]:
     """
@@ -18,50 +33,65 @@ def validate_dataframe(df: pd.DataFrame) -> Tuple[pd.DataFrame, List[ValidationI
     """
     issues: List[ValidationIssue] = []
 
-    expected_cols = ["Serial No","Transaction Date","Value Date","Description","Cheque Number","Debit","Credit","Balance"]
-    missing = [c for c in expected_cols if c not in df.columns]
+    present = set(df.columns)
+    missing = [c for c in EXPECTED_COLS if c not in present]
     if missing:
         issues.append(ValidationIssue(serial_no=None, level="error", message=f"Missing required columns: {missing}"))
         return df, issues
 
-    df = df[expected_cols].copy()
+    df = df[list(EXPECTED_COLS)].copy()
 
-    try:
-        ser = df["Serial No"].astype(int)
+    ser = df["Serial No"]
+    if not pd.api.types.is_integer_dtype(ser) or ser.hasnans:
+        num = pd.to_numeric(ser, errors="coerce")
+        bad = (num.isna() | (num % 1 != 0)).fillna(True).astype(bool)
+        if bad.any():
+            issues.extend(ValidationIssue(serial_no=None, level="error",
+                                          message=f"Serial No column is not numeric: {v!r}",
+                                          context={"row": i})
+                          for i, v in ser[bad].items())
+            return df, issues
+        ser = num.astype("int64")
         df["Serial No"] = ser
-        expected = list(range(int(ser.min()), int(ser.max()) + 1))
-        if ser.tolist() != expected:
-            issues.append(ValidationIssue(serial_no=None, level="warning",
-                                          message="Serial numbers are not perfectly sequential. This may indicate missing/duplicate rows.",
-                                          context={"min": int(ser.min()), "max": int(ser.max())}))
-    except Exception as e:
-        issues.append(ValidationIssue(serial_no=None, level="error", message=f"Serial No column is not numeric: {e}"))
-        return df, issues
 
-    for _, row in df.iterrows():
-        sn = int(row["Serial No"])
-        for col in ["Debit","Credit","Balance"]:
-            if not validate_numeric(row[col]):
-                issues.append(ValidationIssue(serial_no=sn, level="error",
-                                              message=f"Invalid numeric format in {col}: {row[col]}"))
-
-        if row["Balance"] in (None, ""):
-            issues.append(ValidationIssue(serial_no=sn, level="error", message="Missing Balance value"))
-
-        d, c = (row["Debit"] or ""), (row["Credit"] or "")
-        if (d == "" and c == "") or (d != "" and c != ""):
-            issues.append(ValidationIssue(serial_no=sn, level="warning",
-                                          message="Expected exactly one of Debit/Credit to be filled for a transaction."))
-
-        if "," in (row["Description"] or ""):
-            issues.append(ValidationIssue(serial_no=sn, level="warning",
-                                          message="Description contains a comma. CSV output is configured to avoid quotes; comma was replaced with a space."))
-            df.loc[df["Serial No"] == sn, "Description"] = (row["Description"] or "").replace(",", " ")
-
-        if not row["Transaction Date"]:
-            issues.append(ValidationIssue(serial_no=sn, level="error", message="Missing Transaction Date"))
-        if not row["Value Date"]:
-            issues.append(ValidationIssue(serial_no=sn, level="warning", message="Missing Value Date"))
+    # Sequential means every step is exactly +1 (same as comparing against range(min, max + 1)).
+    arr = ser.to_numpy()
+    if arr.size and not np.array_equal(arr, np.arange(arr[0], arr[0] + arr.size, dtype=arr.dtype)):
+        issues.append(ValidationIssue(serial_no=None, level="warning",
+                                      message="Serial numbers are not perfectly sequential. This may indicate missing/duplicate rows.",
+                                      context={"min": int(ser.min()), "max": int(ser.max())}))
+
+    sn = df["Serial No"]
+
+    for col in ["Debit","Credit","Balance"]:
+        vals = _as_text(df[col])
+        invalid = (vals != "") & ~vals.str.match(NUMERIC_OK)
+        issues.extend(ValidationIssue(serial_no=s, level="error", message=f"Invalid numeric format in {col}: {v}")
+                      for s, v in zip(sn[invalid].tolist(), df.loc[invalid, col].tolist()))
+
+    issues.extend(ValidationIssue(serial_no=s, level="error", message="Missing Balance value")
+                  for s in sn[_as_text(df["Balance"]) == ""].tolist())
+
+    debit_filled = _as_text(df["Debit"]) != ""
+    credit_filled = _as_text(df["Credit"]) != ""
+    issues.extend(ValidationIssue(serial_no=s, level="warning",
+                                  message="Expected exactly one of Debit/Credit to be filled for a transaction.")
+                  for s in sn[debit_filled == credit_filled].tolist())
+
+    desc = _as_text(df["Description"])
+    # pandas 3 already returns Arrow-backed strings here; only older pandas pays for the conversion.
+    if _DESC_DTYPE is not None and getattr(desc.dtype, "storage", None) != "pyarrow":
+        desc = desc.astype(_DESC_DTYPE)
+    has_comma = desc.str.contains(",", regex=False)
+    issues.extend(ValidationIssue(serial_no=s, level="warning",
+                                  message="Description contains a comma. CSV output is configured to avoid quotes; comma was replaced with a space.")
+                  for s in sn[has_comma].tolist())
+    df.loc[has_comma, "Description"] = desc[has_comma].str.replace(",", " ", regex=False)
+
+    issues.extend(ValidationIssue(serial_no=s, level="error", message="Missing Transaction Date")
+                  for s in sn[_as_text(df["Transaction Date"]) == ""].tolist())
+    issues.extend(ValidationIssue(serial_no=s, level="warning", message="Missing Value Date")
+                  for s in sn[_as_text(df["Value Date"]) == ""].tolist())
 
     return df, issues
 